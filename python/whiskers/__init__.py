@@ -131,7 +131,7 @@ from .type import (
 )
 
 # Connection Objects
-from .db_connection import connect, Connection
+from .db_connection import connect, async_connect, Connection
 
 # Cursor Objects
 from .cursor import Cursor
@@ -148,7 +148,7 @@ SQL_WCHAR = ConstantsDDBC.SQL_WCHAR.value
 SQL_WMETADATA = -99
 
 from .pooling import PoolingManager
-def pooling(max_size=100, idle_timeout=600, enabled=True):
+def pooling(max_size=100, idle_timeout=600, enabled=True, ping_after_idle_seconds=30):
 #     """
 #     Enable connection pooling with the specified parameters.
 #     By default:
@@ -157,6 +157,9 @@ def pooling(max_size=100, idle_timeout=600, enabled=True):
 #     Args:
 #         max_size (int): Maximum number of connections in the pool.
 #         idle_timeout (int): Time in seconds before idle connections are closed.
+#         ping_after_idle_seconds (int): Idle time in seconds after which a pooled
+#             connection is pinged with a round trip on checkout; younger connections
+#             are reused as-is.
     
 #     Returns:
 #         None
@@ -164,7 +167,7 @@ def pooling(max_size=100, idle_timeout=600, enabled=True):
     if not enabled:
         PoolingManager.disable()
     else:
-        PoolingManager.enable(max_size, idle_timeout)
+        PoolingManager.enable(max_size, idle_timeout, ping_after_idle_seconds)
 
 import sys
 _original_module_setattr = sys.modules[__name__].__setattr__
@@ -35,6 +35,18 @@ UTF16_ENCODINGS = frozenset([
     'utf-16be'
 ])
 
+def _is_connection_dead_error(error: Exception) -> bool:
+    """
+    Check whether an exception raised by a statement means the connection is dead.
+
+    whiskers_native surfaces socket failures as ConnectionError and use of a closed
+    connection as RuntimeError; server errors never mean the link is gone.
+    """
+    if isinstance(error, ConnectionError):
+        return True
+    return isinstance(error, RuntimeError) and "Connection is closed" in str(error)
+
+
 def _validate_encoding(encoding: str) -> bool:
     """
     Cached encoding validation using codecs.lookup().
@@ -191,10 +203,14 @@ class Connection:
         # It prevents memory leaks by ensuring that cursors are cleaned up when no longer in use without requiring explicit deletion.
         # TODO: Think and implement scenarios for multi-threaded access to cursors
         self._cursors = weakref.WeakSet()
+        # Cursors that may hold back statements (pipelined mode or begin_batch())
+        self._pending_cursors = weakref.WeakSet()
 
         # Initialize output converters dictionary and its lock for thread safety
         self._output_converters = {}
         self._converters_lock = threading.Lock()
+        # Bumped on every converter change so cursors can cache per-column lookups
+        self._converters_version = 0
 
         # Auto-enable pooling if user never called
         if not PoolingManager.is_initialized():
@@ -207,10 +223,60 @@ class Connection:
                 self._conn = pooled
             else:
                 self._conn = ddbc_bindings.Connection(self.connection_str, self._pooling, self._attrs_before)
+            # Pooled connections are handed out without a liveness probe; the
+            # first statement on them is allowed one evict-and-retry (see
+            # _claim_first_statement()).
+            self._pooled_unverified = pooled is not None
         except ConnectionError as e:
             raise OperationalError(str(e), "") from e
         self.setautocommit(autocommit)
 
+    def _claim_first_statement(self) -> bool:
+        """
+        Record that a statement is about to be sent on this connection.
+
+        Every path that sends a statement calls this (cursors do so from
+        _reset_cursor()), so only the very first statement after a pool
+        checkout can be retried on a fresh connection; a retry after that
+        would silently drop the work already done in the open transaction.
+        Only Cursor.execute() retries: when executemany(), a batch or a
+        catalog call is the first statement, a lost link is raised as is.
+
+        Returns:
+            bool: True if this is the first statement on a pooled connection.
+        """
+        first = self._pooled_unverified
+        self._pooled_unverified = False
+        return first
+
+    def _replace_dead_pooled_conn(self, error: Exception) -> bool:
+        """
+        Replace a pooled connection that failed its first statement.
+
+        Only called for the statement _claim_first_statement() reported as the first.
+
+        Args:
+            error (Exception): The exception raised by the first statement.
+
+        Returns:
+            bool: True if the dead connection was evicted and a fresh one opened,
+            in which case the caller should retry the statement once.
+        """
+        if not _is_connection_dead_error(error):
+            return False
+        log('warning', "Pooled connection is dead, reconnecting: %s", error)
+        autocommit = self._conn.get_autocommit()
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+        try:
+            self._conn = ddbc_bindings.Connection(self.connection_str, self._pooling, self._attrs_before)
+        except ConnectionError as e:
+            raise OperationalError(str(e), "") from e
+        self._conn.set_autocommit(autocommit)
+        return True
+
     def _construct_connection_string(self, connection_str: str = "", **kwargs) -> str:
         """
         Construct the connection string by concatenating the connection string 
@@ -632,6 +698,7 @@ class Connection:
         """
         with self._converters_lock:
             self._output_converters[sqltype] = func
+            self._converters_version += 1
             # Pass to the underlying connection if native implementation supports it
             if hasattr(self._conn, 'add_output_converter'):
                 self._conn.add_output_converter(sqltype, func)
@@ -671,6 +738,7 @@ class Connection:
         with self._converters_lock:
             if sqltype in self._output_converters:
                 del self._output_converters[sqltype]
+                self._converters_version += 1
                 # Pass to the underlying connection if native implementation supports it
                 if hasattr(self._conn, 'remove_output_converter'):
                     self._conn.remove_output_converter(sqltype)
@@ -687,6 +755,7 @@ class Connection:
         """
         with self._converters_lock:
             self._output_converters.clear()
+            self._converters_version += 1
             # Pass to the underlying connection if native implementation supports it
             if hasattr(self._conn, 'clear_output_converters'):
                 self._conn.clear_output_converters()
@@ -1111,10 +1180,26 @@ class Connection:
                 ddbc_error="Cannot commit on a closed connection",
             )
     
+        self._flush_cursors()
+
         # Commit the current transaction
         self._conn.commit()
         log('info', "Transaction committed successfully.")
 
+    def _flush_cursors(self, exclude=None) -> None:
+        """
+        Send statements still held back by pipelined or batching cursors.
+
+        Called before ending the transaction and before any cursor executes, so
+        statements on this connection see the rows other cursors have buffered.
+
+        Args:
+            exclude: A cursor to leave alone (the one about to execute).
+        """
+        for cursor in list(self._pending_cursors):
+            if cursor is not exclude:
+                cursor._flush_pending()
+
     def rollback(self) -> None:
         """
         Roll back the current transaction.
@@ -1134,6 +1219,8 @@ class Connection:
                 ddbc_error="Cannot rollback on a closed connection",
             )
     
+        self._flush_cursors()
+
         # Roll back the current transaction
         self._conn.rollback()
         log('info', "Transaction rolled back successfully.")
@@ -1157,6 +1244,10 @@ class Connection:
         
         # Close all cursors first, but don't let one failure stop the others
         if hasattr(self, '_cursors'):
+            # Statements held back by pipelined or batching cursors are sent
+            # first and their errors raised; the connection stays open then
+            self._flush_cursors()
+
             # Convert to list to avoid modification during iteration
             cursors_to_close = list(self._cursors)
             close_errors = []
@@ -1187,20 +1278,17 @@ class Connection:
                     except Exception:
                         pass
                 # Return to pool if pooling is enabled
+                # Returned without a probe; checkout pings it once idle for
+                # ping_after_idle_seconds and execute() retries on a lost link
                 if self._pooling and ddbc_bindings._pool._enabled:
                     try:
-                        # Test if connection is still valid before pooling
-                        h = self._conn.alloc_statement_handle()
-                        h.free()
                         ddbc_bindings._pool.put(self.connection_str, self._conn)
-                        self._conn = None
                     except Exception:
-                        # Connection is invalid, just close it
                         try:
                             self._conn.close()
                         except Exception:
                             pass
-                        self._conn = None
+                    self._conn = None
                 else:
                     self._conn.close()
                     self._conn = None
@@ -9,7 +9,9 @@ Resource Management:
 - Use close() to release resources held by the cursor as soon as it is no longer needed.
 """
 import decimal
+import re
 import uuid
+from collections import deque
 import datetime
 import warnings
 from typing import List, Union, Any
@@ -17,15 +19,31 @@ from whiskers.constants import ConstantsDDBC as ddbc_sql_const, SQLTypes
 from whiskers.helpers import check_error, log
 from whiskers import ddbc_bindings
 from whiskers.exceptions import InterfaceError, NotSupportedError, ProgrammingError
-from whiskers.row import Row
+from whiskers.row import Row, RowBatch, row_class
 from whiskers import get_settings
 
+# The only INSERT form pipelined mode buffers: one VALUES row and nothing after it,
+# which executemany() rewrites into multi-row INSERTs. An OUTPUT clause or a trailing
+# statement (e.g. SELECT SCOPE_IDENTITY()) returns results a batch would drop.
+_PIPELINABLE_INSERT = re.compile(
+    r"\s*INSERT\b(?:(?!\bOUTPUT\b)[^;])*?\bVALUES\s*\([^;()]*\)\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# SQL types whose values come back as decimal.Decimal
+_DECIMAL_SQL_TYPES = frozenset((
+    ddbc_sql_const.SQL_DECIMAL.value,
+    ddbc_sql_const.SQL_NUMERIC.value,
+    -150,  # SQL_SS_VARIANT
+))
+
 # Constants for string handling
 MAX_INLINE_CHAR = 4000  # NVARCHAR/VARCHAR inline limit; this triggers NVARCHAR(MAX)/VARCHAR(MAX) + DAE
 SMALLMONEY_MIN = decimal.Decimal('-214748.3648')
 SMALLMONEY_MAX = decimal.Decimal('214748.3647')
 MONEY_MIN = decimal.Decimal('-922337203685477.5808')
 MONEY_MAX = decimal.Decimal('922337203685477.5807')
+FETCHONE_PREFETCH_ROWS = 256  # Rows fetchone() pulls from the driver at a time (at least arraysize)
 
 
 class Cursor:
@@ -38,6 +56,11 @@ class Cursor:
         rowcount: Number of rows produced or affected by the last execute operation.
         arraysize: Number of rows to fetch at a time with fetchmany().
         rownumber: Track the current row index in the result set.
+        pipelined: Buffer repeated parameterized INSERTs and send them as one batch.
+            Only the plain ``INSERT ... VALUES (?, ...)`` form is buffered; statements
+            with an OUTPUT clause or a trailing statement run immediately. Buffered rows
+            are sent before this cursor's next statement or fetch, before any other
+            cursor of the connection executes, and on commit, rollback or close.
 
     Methods:
         __init__(connection_str) -> None.
@@ -46,9 +69,12 @@ class Cursor:
         close() -> None.
         execute(operation, parameters=None) -> Cursor.
         executemany(operation, seq_of_parameters) -> None.
+        begin_batch() -> None.
+        flush_batch() -> Cursor.
         fetchone() -> Single sequence or None if no more data is available.
         fetchmany(size=None) -> Sequence of sequences (e.g. list of tuples).
         fetchall() -> Sequence of sequences (e.g. list of tuples).
+        fetchbatch() -> RowBatch of all remaining rows, wrapped lazily.
         nextset() -> True if there is another result set, None otherwise.
         next() -> Fetch the next row from the cursor.
         setinputsizes(sizes) -> None.
@@ -102,9 +128,32 @@ class Cursor:
         self._has_result_set = False  # Track if we have an active result set
         self._last_fetch_size = 0  # Track size of last fetch block for skip adjustment
         self._skip_increment_for_next_fetch = False  # Track if we need to skip incrementing the row index
+        self._prefetched = deque()  # Raw rows read ahead by fetchone(), not yet returned
 
         self.messages = []  # Store diagnostic messages
 
+        # Column name -> index maps, built once per description and shared by its rows
+        self._column_maps_desc = None
+        self._column_name_map = None
+        self._column_map_lower = None
+        # (row class, column_map, column_map_lower, converters) for the current result set
+        self._row_factory = None
+        self._row_factory_key = None
+        # Whether the result set may hold Decimal values; see _initialize_description()
+        self._has_decimal_col = True
+
+        # Output converters resolved per column, cached per (description, converter version)
+        self._converters_key = None
+        self._converters_plan = None
+
+        # Pipelined mode: back-to-back executes of one INSERT are buffered and
+        # sent as a single executemany() batch (see _flush_pipeline)
+        self.pipelined = False
+        self._pipeline_sql = None
+        self._pipeline_params = []
+        # Explicit batching: executes are queued natively until flush_batch()
+        self._batching = False
+
     def _is_unicode_string(self, param):
         """
         Check if a string contains non-ASCII characters.
@@ -478,7 +527,15 @@ class Cursor:
     def _reset_cursor(self) -> None:
         """
         Reset the DDBC statement handle.
+
+        Statements still held back by pipelined mode or begin_batch() are sent
+        first, since freeing the handle would discard them.
         """
+        if self._pipeline_sql is not None or self._batching:
+            self._flush_pending()
+        # Whatever follows a reset goes to the server, so a later failure is
+        # no longer on the first statement of a pooled connection
+        self._connection._claim_first_statement()
         if self.hstmt:
             self.hstmt.free()
             self.hstmt = None
@@ -502,6 +559,9 @@ class Cursor:
             # Do nothing - not calling _check_closed() here since we want this to be idempotent
             return
 
+        if self._pipeline_sql is not None or self._batching:
+            self._flush_pending()
+
         # Clear messages per DBAPI
         self.messages = []
         
@@ -683,6 +743,7 @@ class Cursor:
         """Initialize the description attribute from column metadata."""
         if not column_metadata:
             self.description = None
+            self._has_decimal_col = False
             return
 
         description = []
@@ -705,6 +766,9 @@ class Cursor:
                 col["Nullable"] == ddbc_sql_const.SQL_NULLABLE.value, # null_ok
             ))
         self.description = description
+        # Rows without Decimal values can skip the per-value check in Row.__str__;
+        # sql_variant columns may carry them too
+        self._has_decimal_col = any(col["DataType"] in _DECIMAL_SQL_TYPES for col in column_metadata)
 
     def _map_data_type(self, sql_type):
         """
@@ -793,6 +857,7 @@ class Cursor:
         self._has_result_set = True
         self._skip_increment_for_next_fetch = False
         self._last_fetch_size = 0
+        self._prefetched.clear()
 
     def _increment_rownumber(self):
         """
@@ -830,6 +895,7 @@ class Cursor:
         self._rownumber = -1
         self._has_result_set = False
         self._skip_increment_for_next_fetch = False
+        self._prefetched.clear()
 
     def __iter__(self):
         """
@@ -900,6 +966,22 @@ class Cursor:
             del self._original_fetchall
             
         self._check_closed()  # Check if the cursor is closed
+
+        if self._connection._pending_cursors:
+            # Let this statement see rows other cursors of the connection still hold back
+            self._connection._flush_cursors(exclude=self)
+
+        if self._batching:
+            if len(parameters) == 1 and isinstance(parameters[0], (tuple, list)):
+                parameters = parameters[0]
+            ddbc_bindings.DDBCSQLBatchAppend(self.hstmt, operation, list(parameters))
+            return self
+        if self.pipelined and self._buffer_pipelined(operation, parameters):
+            return self
+        if self._pipeline_sql is not None:
+            self._flush_pipeline()
+
+        first_statement = self._connection._claim_first_statement()
         if reset_cursor:
             self._reset_cursor()
 
@@ -969,14 +1051,28 @@ class Cursor:
                     parameters_type[i].inputOutputType,
                 )
 
-        ret = ddbc_bindings.DDBCSQLExecute(
-            self.hstmt,
-            operation,
-            parameters,
-            parameters_type,
-            self.is_stmt_prepared,
-            use_prepare,
-        )
+        try:
+            ret = ddbc_bindings.DDBCSQLExecute(
+                self.hstmt,
+                operation,
+                parameters,
+                parameters_type,
+                self.is_stmt_prepared,
+                use_prepare,
+            )
+        except Exception as e:
+            # A pooled connection that died while idle gets one retry on a fresh connection
+            if not first_statement or not self._connection._replace_dead_pooled_conn(e):
+                raise
+            self._reset_cursor()
+            ret = ddbc_bindings.DDBCSQLExecute(
+                self.hstmt,
+                operation,
+                parameters,
+                parameters_type,
+                self.is_stmt_prepared,
+                use_prepare,
+            )
         # Check return code
         try:
             
@@ -1064,6 +1160,7 @@ class Cursor:
         # Use fallback description if provided and current description is empty
         if not self.description and fallback_description:
             self.description = fallback_description
+            self._has_decimal_col = True
         
         # Define column names in ODBC standard order
         self._column_map = {}
@@ -1501,6 +1598,9 @@ class Cursor:
             Error: If the operation fails.
         """
         self._check_closed()
+        if self._connection._pending_cursors:
+            # Flushes this cursor's own pending statements as well
+            self._connection._flush_cursors()
         self._reset_cursor()
         self.messages = []
 
@@ -1632,8 +1732,12 @@ class Cursor:
         
         if any_dae:
             log('debug', "DAE parameters detected. Falling back to row-by-row execution with streaming.")
-            for row in seq_of_parameters:
-                self.execute(operation, row)
+            pipelined, self.pipelined = self.pipelined, False
+            try:
+                for row in seq_of_parameters:
+                    self.execute(operation, row)
+            finally:
+                self.pipelined = pipelined
             return
         
         # Process parameters into column-wise format with possible type conversions
@@ -1696,6 +1800,234 @@ class Cursor:
             # Reset input sizes after execution
             self._reset_inputsizes()
 
+    def _buffer_pipelined(self, operation, parameters):
+        """
+        Queue a parameterized INSERT for the pipeline instead of executing it.
+
+        Only plain INSERT ... VALUES (...) statements (see _PIPELINABLE_INSERT)
+        with parameters and without input sizes are buffered. A different
+        statement flushes the pending batch first and starts a new one.
+
+        Returns:
+            bool: True if the statement was buffered.
+        """
+        if len(parameters) == 1 and isinstance(parameters[0], (tuple, list)):
+            parameters = parameters[0]
+        if not parameters or self._inputsizes:
+            return False
+        if operation != self._pipeline_sql:
+            if not _PIPELINABLE_INSERT.match(operation):
+                return False
+            if self._pipeline_sql is not None:
+                self._flush_pipeline()
+            self._reset_cursor()
+            self.messages = []
+            self.description = None
+            self.rowcount = -1
+            self._pipeline_sql = operation
+            self._connection._pending_cursors.add(self)
+        self._pipeline_params.append(list(parameters))
+        return True
+
+    def _flush_pipeline(self):
+        """
+        Send the INSERTs buffered in pipelined mode as one executemany() batch.
+
+        Called before any other statement, fetch, nextset, commit, rollback or
+        close, so errors from buffered rows are raised there.
+        """
+        operation, seq_of_parameters = self._pipeline_sql, self._pipeline_params
+        self._pipeline_sql = None
+        self._pipeline_params = []
+        self.executemany(operation, seq_of_parameters)
+
+    def _flush_pending(self):
+        """Send whatever pipelined mode or begin_batch() is still holding back."""
+        self._connection._pending_cursors.discard(self)
+        if self._pipeline_sql is not None:
+            self._flush_pipeline()
+        if self._batching:
+            self.flush_batch()
+
+    def begin_batch(self) -> None:
+        """
+        Start queueing statements instead of sending each one to the server.
+
+        Until flush_batch() is called, execute() only substitutes the parameters
+        and appends the statement to a native buffer; flush_batch() then sends
+        the whole queue as one SQL batch, saving a round trip per statement.
+        Fetching, executemany(), nextset(), close(), commit() and rollback()
+        flush the batch first. Errors of queued statements are raised there.
+
+        Statements that must start a batch on their own (CREATE PROCEDURE,
+        CREATE VIEW, ...) cannot be queued.
+        """
+        self._check_closed()
+        if self._batching:
+            return
+        if self._pipeline_sql is not None:
+            self._flush_pipeline()
+        self._reset_cursor()
+        self.messages = []
+        self.description = None
+        self.rowcount = -1
+        ddbc_bindings.DDBCSQLBeginBatch(self.hstmt)
+        self._batching = True
+        self._connection._pending_cursors.add(self)
+
+    def flush_batch(self) -> 'Cursor':
+        """
+        Send the statements queued since begin_batch() in one round trip.
+
+        Afterwards the cursor behaves as if the batch had been passed to
+        execute(): the first result set, if any, can be fetched, and rowcount
+        is that of the last statement when the batch starts with a DML statement.
+
+        Returns:
+            The cursor itself, for method chaining.
+        """
+        self._check_closed()
+        if not self._batching:
+            return self
+        self._batching = False
+
+        try:
+            ret = ddbc_bindings.DDBCSQLFlushBatch(self.hstmt)
+            check_error(ddbc_sql_const.SQL_HANDLE_STMT.value, self.hstmt, ret)
+        except Exception as e:
+            log('warning', "Batch failed, resetting cursor: %s", e)
+            self._reset_cursor()
+            raise
+
+        if self.hstmt:
+            self.messages.extend(ddbc_bindings.DDBCSQLGetAllDiagRecords(self.hstmt))
+
+        column_metadata = []
+        try:
+            ddbc_bindings.DDBCSQLDescribeCol(self.hstmt, column_metadata)
+            self._initialize_description(column_metadata)
+        except Exception:
+            self.description = None
+
+        if self.description:
+            self.rowcount = -1
+            self._reset_rownumber()
+        else:
+            self.rowcount = ddbc_bindings.DDBCSQLRowCount(self.hstmt)
+            self._clear_rownumber()
+        return self
+
+    def _rewind_prefetch(self):
+        """Give rows read ahead by fetchone() back to the driver before moving its position otherwise."""
+        if self._prefetched:
+            ddbc_bindings.DDBCSQLFetchScroll(self.hstmt, ddbc_sql_const.SQL_FETCH_RELATIVE.value,
+                                             -len(self._prefetched), [])
+            self._prefetched.clear()
+
+    def _get_column_maps(self):
+        """
+        Return the column name -> index maps for the current result set.
+
+        Both maps are built once per description and the same dict objects are
+        handed to every row, instead of being rebuilt or copied per row. The
+        lowercase map is only returned while cursor.lowercase is set, so rows
+        carry the flag in the map they were built with.
+
+        Returns:
+            tuple: (column_map, column_map_lower), or (None, None) without a result set.
+        """
+        description = self.description
+        if self._column_maps_desc is not description:
+            column_map = column_map_lower = None
+            if description:
+                column_map = {d[0]: i for i, d in enumerate(description)}
+                column_map_lower = {}
+                for name, i in column_map.items():
+                    column_map_lower.setdefault(name.lower(), i)
+            self._column_name_map = column_map
+            self._column_map_lower = column_map_lower
+            self._column_maps_desc = description
+        if getattr(self, 'lowercase', False):
+            return self._column_name_map, self._column_map_lower
+        return self._column_name_map, None
+
+    def _get_row_factory(self):
+        """
+        Resolve how rows of the current result set are built.
+
+        The Row subclass (see row.row_class()), both column maps and the output
+        converter plan are resolved together and reused until the description,
+        the lowercase flag or the connection's converters change, so a fetch
+        costs one call and one key comparison. Output converters may return
+        anything, so their presence counts as a Decimal column.
+
+        Returns:
+            tuple: (row_cls, column_map, column_map_lower, converters).
+        """
+        description = self.description
+        lowercase = getattr(self, 'lowercase', False)
+        version = self._connection._converters_version
+        key = self._row_factory_key
+        if key is not None and key[0] is description and key[1] == lowercase and key[2] == version:
+            return self._row_factory
+        column_map, column_map_lower = self._get_column_maps()
+        converters = self._get_output_converters()
+        has_decimal = self._has_decimal_col or converters is not None
+        self._row_factory = (row_class(column_map, column_map_lower, has_decimal),
+                             column_map, column_map_lower, converters)
+        self._row_factory_key = (description, lowercase, version)
+        return self._row_factory
+
+    def _get_output_converters(self):
+        """
+        Resolve the output converters for the current result set.
+
+        Converters are looked up once per column and reused until the description
+        or the connection's registered converters change.
+
+        Returns:
+            list or None: (column index, converter, text_only) tuples for the columns
+            that have a converter, or None if no converter applies.
+        """
+        connection = self._connection
+        if not connection._output_converters or not self.description:
+            return None
+        description = self.description
+        key = self._converters_key
+        if key is not None and key[0] is description and key[1] == connection._converters_version:
+            return self._converters_plan
+
+        version = connection._converters_version
+        wvarchar_converter = connection.get_output_converter(ddbc_sql_const.SQL_WVARCHAR.value)
+        plan = []
+        for i, desc in enumerate(description):
+            converter = connection.get_output_converter(desc[1])
+            if converter is not None:
+                plan.append((i, converter, False))
+            elif wvarchar_converter is not None:
+                # The SQL_WVARCHAR converter is the fallback for text and binary values only
+                plan.append((i, wvarchar_converter, True))
+        self._converters_key = (description, version)
+        self._converters_plan = plan or None
+        return self._converters_plan
+
+    @staticmethod
+    def _convert_values(values, converters):
+        """Apply resolved output converters in place to one row of raw values (a list)."""
+        for i, converter, text_only in converters:
+            value = values[i]
+            if value is None:
+                continue
+            if isinstance(value, str):
+                value = value.encode('utf-16-le')
+            elif text_only and not isinstance(value, bytes):
+                continue
+            try:
+                values[i] = converter(value)
+            except Exception:
+                pass
+        return values
+
     def fetchone(self) -> Union[None, Row]:
         """
         Fetch the next row of a query result set.
@@ -1704,21 +2036,27 @@ class Cursor:
             Single Row object or None if no more data is available.
         """
         self._check_closed()  # Check if the cursor is closed
+        if self._pipeline_sql is not None or self._batching:
+            self._flush_pending()
 
-        # Fetch raw data
-        row_data = []
+        # Fetch raw data, reading ahead so most calls don't cross into the driver
+        prefetched = self._prefetched
         try:
-            ret = ddbc_bindings.DDBCSQLFetchOne(self.hstmt, row_data)
-            
-            if self.hstmt:
-                self.messages.extend(ddbc_bindings.DDBCSQLGetAllDiagRecords(self.hstmt))
-            
-            if ret == ddbc_sql_const.SQL_NO_DATA.value:
+            if not prefetched:
+                rows_data = []
+                ddbc_bindings.DDBCSQLFetchMany(self.hstmt, rows_data,
+                                               max(self.arraysize, FETCHONE_PREFETCH_ROWS))
+                if self.hstmt:
+                    self.messages.extend(ddbc_bindings.DDBCSQLGetAllDiagRecords(self.hstmt))
+                prefetched.extend(rows_data)
+
+            if not prefetched:
                 # No more data available
                 if self._next_row_index == 0 and self.description is not None:
                     # This is an empty result set, set rowcount to 0
                     self.rowcount = 0
                 return None
+            row_data = prefetched.popleft()
             
             # Update internal position after successful fetch
             if self._skip_increment_for_next_fetch:
@@ -1731,11 +2069,10 @@ class Cursor:
             self.rowcount = self._next_row_index
             
             # Create and return a Row object, passing column name map if available
-            column_map = getattr(self, '_column_name_map', None)
-            row = Row(self, self.description, row_data, column_map)
-            if hasattr(self.connection, '_output_converters') and self.connection._output_converters:
-                row._apply_output_converters(self, self.description)
-            return row
+            row_cls, column_map, column_map_lower, converters = self._get_row_factory()
+            if converters:
+                row_data = self._convert_values(row_data, converters)
+            return row_cls(self, self.description, row_data, column_map, column_map_lower)
         except Exception as e:
             # On error, don't increment rownumber - rethrow the error
             raise e
@@ -1751,6 +2088,9 @@ class Cursor:
             List of Row objects.
         """
         self._check_closed()  # Check if the cursor is closed
+        if self._pipeline_sql is not None or self._batching:
+            self._flush_pending()
+        self._rewind_prefetch()
         if not self._has_result_set and self.description:
             self._reset_rownumber()
 
@@ -1783,14 +2123,13 @@ class Cursor:
                 self.rowcount = self._next_row_index
             
             # Convert raw data to Row objects
-            column_map = getattr(self, '_column_name_map', None)
+            row_cls, column_map, column_map_lower, converters = self._get_row_factory()
             desc = self.description
-            has_converters = hasattr(self.connection, '_output_converters') and self.connection._output_converters
-            rows = [Row(self, desc, row_data, column_map) for row_data in rows_data]
-            if has_converters:
-                for row in rows:
-                    row._apply_output_converters(self, desc)
-            return rows
+            if converters:
+                convert = self._convert_values
+                return [row_cls(self, desc, convert(row_data, converters), column_map, column_map_lower)
+                        for row_data in rows_data]
+            return [row_cls(self, desc, row_data, column_map, column_map_lower) for row_data in rows_data]
         except Exception as e:
             # On error, don't increment rownumber - rethrow the error
             raise e
@@ -1803,20 +2142,21 @@ class Cursor:
             List of Row objects.
         """
         self._check_closed()  # Check if the cursor is closed
+        if self._pipeline_sql is not None or self._batching:
+            self._flush_pending()
+        self._rewind_prefetch()
         if not self._has_result_set and self.description:
             self._reset_rownumber()
 
         # Fetch raw data
         rows_data = []
         try:
-            # Fast path: use NativeRow objects built entirely in Rust
-            has_converters = hasattr(self.connection, '_output_converters') and self.connection._output_converters
-            if not has_converters and hasattr(ddbc_bindings, 'DDBCSQLFetchAllNative'):
-                column_map = getattr(self, '_column_name_map', None)
-                if column_map is None and self.description:
-                    column_map = {d[0]: i for i, d in enumerate(self.description)}
-                    self._column_name_map = column_map
-                rows = ddbc_bindings.DDBCSQLFetchAllNative(self.hstmt, column_map or {}, self)
+            # Fast path: use NativeRow objects built entirely in Rust. They are not
+            # Row instances but share its column maps, lowercase access and equality
+            row_cls, column_map, column_map_lower, converters = self._get_row_factory()
+            if not converters and hasattr(ddbc_bindings, 'DDBCSQLFetchAllNative'):
+                rows = ddbc_bindings.DDBCSQLFetchAllNative(self.hstmt, column_map or {}, self,
+                                                           column_map_lower)
 
                 if self.hstmt:
                     self.messages.extend(ddbc_bindings.DDBCSQLGetAllDiagRecords(self.hstmt))
@@ -1851,18 +2191,61 @@ class Cursor:
                 self.rowcount = self._next_row_index
             
             # Convert raw data to Row objects
-            column_map = getattr(self, '_column_name_map', None)
             desc = self.description
-            has_converters = hasattr(self.connection, '_output_converters') and self.connection._output_converters
-            rows = [Row(self, desc, row_data, column_map) for row_data in rows_data]
-            if has_converters:
-                for row in rows:
-                    row._apply_output_converters(self, desc)
-            return rows
+            if converters:
+                convert = self._convert_values
+                return [row_cls(self, desc, convert(row_data, converters), column_map, column_map_lower)
+                        for row_data in rows_data]
+            return [row_cls(self, desc, row_data, column_map, column_map_lower) for row_data in rows_data]
         except Exception as e:
             # On error, don't increment rownumber - rethrow the error
             raise e
 
+    def fetchbatch(self) -> RowBatch:
+        """
+        Fetch all (remaining) rows of a query result as a RowBatch.
+
+        Unlike fetchall(), values are kept in one flat list and Row objects are
+        only built when a row is indexed or iterated; use RowBatch.columns() to
+        hand the data to columnar consumers without any per-row objects.
+
+        Returns:
+            RowBatch of the remaining rows.
+        """
+        self._check_closed()  # Check if the cursor is closed
+        if self._pipeline_sql is not None or self._batching:
+            self._flush_pending()
+        self._rewind_prefetch()
+        if not self._has_result_set and self.description:
+            self._reset_rownumber()
+
+        values, width = ddbc_bindings.DDBCSQLFetchAllFlat(self.hstmt)
+
+        if self.hstmt:
+            self.messages.extend(ddbc_bindings.DDBCSQLGetAllDiagRecords(self.hstmt))
+
+        count = len(values) // width if width else 0
+
+        # Update rownumber for the number of rows actually fetched
+        if count and self._has_result_set:
+            self._next_row_index += count
+            self._rownumber = self._next_row_index - 1
+
+        # Centralize rowcount assignment after fetch
+        if count == 0 and self._next_row_index == 0:
+            self.rowcount = 0
+        else:
+            self.rowcount = self._next_row_index
+
+        row_cls, column_map, column_map_lower, converters = self._get_row_factory()
+        if converters:
+            convert = self._convert_values
+            for start in range(0, count * width, width):
+                values[start:start + width] = convert(values[start:start + width], converters)
+
+        return RowBatch(self, self.description, values, width, column_map, column_map_lower,
+                        row_cls)
+
     def nextset(self) -> Union[bool, None]:
         """
         Skip to the next available result set.
@@ -1874,6 +2257,8 @@ class Cursor:
             Error: If the previous call to execute did not produce any result set.
         """
         self._check_closed()  # Check if the cursor is closed
+        if self._pipeline_sql is not None or self._batching:
+            self._flush_pending()
 
         # Clear messages per DBAPI
         self.messages = []
@@ -2028,6 +2413,7 @@ class Cursor:
           - absolute(k>0): next fetch returns row index k (0-based); rownumber == k after scroll.
         """
         self._check_closed()
+        self._rewind_prefetch()
         
         # Clear messages per DBAPI
         self.messages = []
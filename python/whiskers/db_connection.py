@@ -3,6 +3,9 @@ Copyright (c) Microsoft Corporation.
 Licensed under the MIT license.
 This module provides a way to create a new connection object to interact with the database.
 """
+import asyncio
+import functools
+
 from whiskers.connection import Connection
 
 def connect(connection_str: str = "", autocommit: bool = False, attrs_before: dict = None, timeout: int = 0, **kwargs) -> Connection:
@@ -35,3 +38,29 @@ def connect(connection_str: str = "", autocommit: bool = False, attrs_before: di
     """
     conn = Connection(connection_str, autocommit=autocommit, attrs_before=attrs_before, timeout=timeout, **kwargs)
     return conn
+
+
+async def async_connect(connection_str: str = "", autocommit: bool = False, attrs_before: dict = None, timeout: int = 0, executor=None, **kwargs) -> Connection:
+    """
+    Awaitable variant of connect() for opening many connections concurrently.
+
+    The blocking TCP connect and login run on `executor` (the event loop's default
+    thread pool when None) with the GIL released, so
+    ``await asyncio.gather(*(async_connect(cs) for _ in range(n)))`` overlaps the
+    handshakes on a bounded set of worker threads instead of one thread per
+    connection. The returned Connection is the regular, synchronous one.
+
+    Args:
+        connection_str, autocommit, attrs_before, timeout, **kwargs: As for connect().
+        executor (concurrent.futures.Executor): Where to run the connect; None uses
+            the running loop's default executor.
+
+    Returns:
+        Connection: A new connection object to interact with the database.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(connect, connection_str, autocommit=autocommit,
+                          attrs_before=attrs_before, timeout=timeout, **kwargs),
+    )
@@ -8,12 +8,16 @@ from whiskers.whiskers_native import (
     ParamInfo,
     NativeRow,
     DDBCSQLExecute,
+    DDBCSQLBeginBatch,
+    DDBCSQLBatchAppend,
+    DDBCSQLFlushBatch,
     DDBCSQLRowCount,
     DDBCSQLDescribeCol,
     DDBCSQLFetchOne,
     DDBCSQLFetchMany,
     DDBCSQLFetchAll,
     DDBCSQLFetchAllNative,
+    DDBCSQLFetchAllFlat,
     DDBCSQLMoreResults,
     DDBCSQLSetStmtAttr,
     DDBCSQLGetAllDiagRecords,
@@ -51,71 +55,295 @@ def DDBCSQLCheckError(handle_type, handle, ret):
 import threading as _threading
 import time as _time
 import collections as _collections
+import weakref as _weakref
+
+def _close_quietly(conn):
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+def _drain_entries(entries):
+    """Pop and close every (conn, returned_at) entry; pop is atomic, so racing owners are safe."""
+    while True:
+        try:
+            conn, _ = entries.pop()
+        except IndexError:
+            return
+        _close_quietly(conn)
+
+class _ThreadCache:
+    """Idle connections parked by one thread, handed back to the shared pool when it exits."""
+    __slots__ = ('_pool', 'conns', '__weakref__')
+
+    def __init__(self, pool):
+        self._pool = pool
+        # conn_str -> deque of (conn, returned_at), oldest on the left
+        self.conns = {}
+
+    def __del__(self):
+        # Runs when the owning thread's threading.local storage is torn down
+        try:
+            for conn_str, entries in self.conns.items():
+                while entries:
+                    conn, returned_at = entries.pop()
+                    self._pool._put_shared(conn_str, conn, returned_at)
+        except Exception:
+            pass
 
 class _ConnectionPool:
-    """Simple connection pool for whiskers_native connections."""
+    """Simple connection pool for whiskers_native connections.
+
+    Checkouts are trusted: a connection returned within ``ping_after_idle_seconds``
+    is handed out with no I/O, an older one is pinged with a round trip first. If the
+    first statement on a checked-out connection is a Cursor.execute() that fails with
+    a connection-lost error, the connection is replaced and the statement retried
+    once; other first statements raise the error.
+
+    Each thread keeps up to ``_THREAD_CACHE_SIZE`` (at most ``max_size``) idle
+    connections per connection string in a lock-free LIFO; only misses and overflow
+    touch the shared pool.
+
+    Idle connections count against ``max_size`` wherever they are parked: every
+    connection string has a deque of ``max_size`` slot tokens and parking a connection
+    pops one. When none is left, the oldest idle connection (shared or in any thread's
+    cache) is closed to make room. A checkout that misses its own cache and the shared
+    pool takes the oldest connection parked by another thread, so thread caches never
+    keep a connection from being reused.
+
+    The shared pool keeps a deque per connection string: ``pop()`` reuses the most
+    recently returned (warmest) connection. Every ``_SWEEP_INTERVAL`` operations
+    expired entries are swept from the left of the shared deques and of every thread
+    cache, so a thread that stops using the database does not keep its sessions open.
+    Checkout and return take no lock: they only use deque ``pop``/``append``/``popleft``
+    and ``dict.setdefault``, which are atomic. ``_lock`` only guards the registry of
+    thread caches, and ``_sweep_lock`` lets a single thread sweep at a time.
+    """
+    _THREAD_CACHE_SIZE = 2
+    _SWEEP_INTERVAL = 64
+
     def __init__(self):
         self._lock = _threading.Lock()
-        self._pools = _collections.defaultdict(list)
+        self._sweep_lock = _threading.Lock()
+        self._pools = {}
+        self._slots = {}
+        self._ops = 0
+        self._tls = _threading.local()
+        self._thread_caches = _weakref.WeakSet()
         self._enabled = False
         self._max_size = 100
         self._idle_timeout = 600
+        self._ping_after_idle = 30
+        self._thread_cache_size = self._THREAD_CACHE_SIZE
 
-    def enable(self, max_size=100, idle_timeout=600):
+    def enable(self, max_size=100, idle_timeout=600, ping_after_idle_seconds=30):
+        if max_size != self._max_size:
+            self._resize_slots(max_size)
         self._enabled = True
         self._max_size = max_size
         self._idle_timeout = idle_timeout
+        self._ping_after_idle = ping_after_idle_seconds
+        self._thread_cache_size = min(self._THREAD_CACHE_SIZE, max_size)
 
     def disable(self):
         self._enabled = False
+        pools, self._pools = self._pools, {}
+        self._slots = {}
+        for conns in pools.values():
+            _drain_entries(conns)
         with self._lock:
-            for conn_str, conns in self._pools.items():
-                for conn, _ in conns:
+            for cache in list(self._thread_caches):
+                for entries in list(cache.conns.values()):
+                    _drain_entries(entries)
+
+    def _resize_slots(self, max_size):
+        """Rebuild the slot tokens for a new max_size, minus the connections already parked."""
+        with self._lock:
+            caches = list(self._thread_caches)
+        slots = {}
+        for conn_str in set(self._slots) | set(self._pools):
+            idle = len(self._pools.get(conn_str, ()))
+            idle += sum(len(cache.conns.get(conn_str, ())) for cache in caches)
+            slots[conn_str] = _collections.deque([None] * max(0, max_size - idle))
+        self._slots = slots
+
+    def _thread_cache(self):
+        try:
+            return self._tls.cache.conns
+        except AttributeError:
+            cache = _ThreadCache(self)
+            with self._lock:
+                self._thread_caches.add(cache)
+            self._tls.cache = cache
+            return cache.conns
+
+    def _claim_slot(self, conn_str):
+        """Take an idle slot for a returned connection; False if the pool is full of thread-cached ones."""
+        slots = self._slots.get(conn_str)
+        if slots is None:
+            slots = self._slots.setdefault(conn_str, _collections.deque([None] * self._max_size))
+        try:
+            slots.pop()
+            return True
+        except IndexError:
+            pass
+        # Evict the coldest idle connection; its slot passes to the returned one
+        pool = self._pools.get(conn_str)
+        try:
+            entry = pool.popleft() if pool is not None else self._steal_cached(conn_str)
+        except IndexError:
+            entry = self._steal_cached(conn_str)
+        if entry is None:
+            return False
+        _close_quietly(entry[0])
+        return True
+
+    def _steal_cached(self, conn_str):
+        """Pop the oldest (conn, returned_at) entry parked in any thread's cache, or None."""
+        with self._lock:
+            caches = list(self._thread_caches)
+        while True:
+            oldest = None
+            for cache in caches:
+                entries = cache.conns.get(conn_str)
+                if entries:
                     try:
-                        conn.close()
-                    except Exception:
-                        pass
-            self._pools.clear()
+                        returned_at = entries[0][1]
+                    except IndexError:
+                        continue
+                    if oldest is None or returned_at < oldest[0]:
+                        oldest = (returned_at, entries)
+            if oldest is None:
+                return None
+            try:
+                return oldest[1].popleft()
+            except IndexError:
+                # Its owner took it meanwhile; look again
+                continue
+
+    def _release_slot(self, conn_str):
+        slots = self._slots.get(conn_str)
+        if slots is not None:
+            slots.append(None)
+
+    def _usable(self, conn, returned_at, now):
+        """Return True if an idle connection may be handed out, closing it otherwise."""
+        idle = now - returned_at
+        if idle < self._idle_timeout:
+            if idle < self._ping_after_idle:
+                return True
+            try:
+                conn.ping()
+                return True
+            except Exception:
+                pass
+        _close_quietly(conn)
+        return False
 
     def get(self, conn_str):
         if not self._enabled:
             return None
-        with self._lock:
-            pool = self._pools.get(conn_str, [])
-            now = _time.monotonic()
-            while pool:
+        now = _time.monotonic()
+        self._maybe_sweep(now)
+        local = self._thread_cache().get(conn_str)
+        while local:
+            try:
+                conn, returned_at = local.pop()
+            except IndexError:
+                break
+            self._release_slot(conn_str)
+            if self._usable(conn, returned_at, now):
+                return conn
+        pool = self._pools.get(conn_str)
+        while pool:
+            try:
                 conn, returned_at = pool.pop()
-                if now - returned_at < self._idle_timeout:
-                    try:
-                        conn.alloc_statement_handle().free()
-                        return conn
-                    except Exception:
-                        try:
-                            conn.close()
-                        except Exception:
-                            pass
-                        continue
-                try:
-                    conn.close()
-                except Exception:
-                    pass
-            return None
+            except IndexError:
+                break
+            self._release_slot(conn_str)
+            if self._usable(conn, returned_at, now):
+                return conn
+        # Other threads' idle connections are fair game before opening a new one
+        while True:
+            entry = self._steal_cached(conn_str)
+            if entry is None:
+                return None
+            self._release_slot(conn_str)
+            if self._usable(entry[0], entry[1], now):
+                return entry[0]
 
     def put(self, conn_str, conn):
         if not self._enabled:
             conn.close()
             return
-        with self._lock:
-            pool = self._pools[conn_str]
-            if len(pool) < self._max_size:
-                pool.append((conn, _time.monotonic()))
-            else:
-                conn.close()
+        now = _time.monotonic()
+        self._maybe_sweep(now)
+        if not self._claim_slot(conn_str):
+            _close_quietly(conn)
+            return
+        cache = self._thread_cache()
+        local = cache.get(conn_str)
+        if local is None:
+            local = cache.setdefault(conn_str, _collections.deque())
+        if len(local) < self._thread_cache_size:
+            local.append((conn, now))
+            return
+        self._put_shared(conn_str, conn, now)
+
+    def _put_shared(self, conn_str, conn, returned_at):
+        """Park a connection that already holds an idle slot in the shared pool."""
+        if not self._enabled:
+            conn.close()
+            return
+        pool = self._pools.get(conn_str)
+        if pool is None:
+            # Unbounded: the slot tokens limit its length, and a maxlen would let
+            # append()/appendleft() drop connections without closing them
+            pool = self._pools.setdefault(conn_str, _collections.deque())
+        pool.append((conn, returned_at))
+        if not self._enabled:
+            # Raced with disable(); don't leave the connection parked
+            _drain_entries(pool)
+
+    def _maybe_sweep(self, now):
+        """Every _SWEEP_INTERVAL calls, close expired entries of the shared pools and thread caches."""
+        self._ops += 1
+        if self._ops % self._SWEEP_INTERVAL or not self._sweep_lock.acquire(blocking=False):
+            return
+        try:
+            for conn_str, pool in list(self._pools.items()):
+                self._sweep_entries(conn_str, pool, now)
+            with self._lock:
+                caches = list(self._thread_caches)
+            for cache in caches:
+                for conn_str, entries in list(cache.conns.items()):
+                    self._sweep_entries(conn_str, entries, now)
+        finally:
+            self._sweep_lock.release()
+
+    def _sweep_entries(self, conn_str, entries, now):
+        """
+        Close expired entries from the old (left) end of one deque.
+
+        The first unexpired entry is put back with appendleft(); none of the
+        deques has a maxlen, so this never pushes another entry out. A checkout
+        racing with the sweep may miss that entry and open a new connection.
+        """
+        while True:
+            try:
+                entry = entries.popleft()
+            except IndexError:
+                return
+            if now - entry[1] < self._idle_timeout:
+                entries.appendleft(entry)
+                return
+            _close_quietly(entry[0])
+            self._release_slot(conn_str)
 
 _pool = _ConnectionPool()
 
-def enable_pooling(max_size=100, idle_timeout=600):
-    _pool.enable(max_size, idle_timeout)
+def enable_pooling(max_size=100, idle_timeout=600, ping_after_idle_seconds=30):
+    _pool.enable(max_size, idle_timeout, ping_after_idle_seconds)
 
 def close_pooling():
     _pool.disable()
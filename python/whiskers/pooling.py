@@ -10,21 +10,23 @@ class PoolingManager:
     _lock = threading.Lock()
     _config = {
         "max_size": 100,
-        "idle_timeout": 600
+        "idle_timeout": 600,
+        "ping_after_idle_seconds": 30
     }
 
     @classmethod
-    def enable(cls, max_size=100, idle_timeout=600):
+    def enable(cls, max_size=100, idle_timeout=600, ping_after_idle_seconds=30):
         with cls._lock:
             if cls._enabled:
                 return
 
-            if max_size <= 0 or idle_timeout < 0:
+            if max_size <= 0 or idle_timeout < 0 or ping_after_idle_seconds < 0:
                 raise ValueError("Invalid pooling parameters")
 
-            ddbc_bindings.enable_pooling(max_size, idle_timeout)
+            ddbc_bindings.enable_pooling(max_size, idle_timeout, ping_after_idle_seconds)
             cls._config["max_size"] = max_size
             cls._config["idle_timeout"] = idle_timeout
+            cls._config["ping_after_idle_seconds"] = ping_after_idle_seconds
             cls._enabled = True
             cls._initialized = True
 
@@ -1,47 +1,32 @@
+from decimal import Decimal
+
+from whiskers import getDecimalSeparator
+
+# Default for column map lookups, so a hit costs a single dict.get()
+_MISSING = object()
+
+
+def _format_decimal(value, sep):
+    s = str(value)
+    return s.replace('.', sep) if sep != '.' else s
+
+
 class Row:
     """
     A row of data from a cursor fetch operation. Provides both tuple-like indexing
     and attribute access to column values.
     """
 
-    __slots__ = ('_values', '_column_map', '_cursor_ref')
+    __slots__ = ('_values', '_column_map', '_column_map_lower', '_cursor_ref')
+    # False on row_class() subclasses whose result set holds no Decimal values
+    _has_decimal_col = True
 
-    def __init__(self, cursor, description, values, column_map=None):
+    def __init__(self, cursor, description, values, column_map=None, column_map_lower=None):
         self._values = values
         self._column_map = column_map
+        self._column_map_lower = column_map_lower
         self._cursor_ref = cursor
     
-    def _apply_output_converters(self, cursor, description):
-        """Apply output converters to raw values in-place."""
-        if not description:
-            return
-        
-        values = self._values
-        if isinstance(values, tuple):
-            values = list(values)
-            self._values = values
-        
-        for i, (value, desc) in enumerate(zip(values, description)):
-            if desc is None or value is None:
-                continue
-            
-            sql_type = desc[1]
-            converter = cursor.connection.get_output_converter(sql_type)
-            
-            if converter is None and isinstance(value, (str, bytes)):
-                from whiskers.constants import ConstantsDDBC
-                converter = cursor.connection.get_output_converter(ConstantsDDBC.SQL_WVARCHAR.value)
-            
-            if converter:
-                try:
-                    if isinstance(value, str):
-                        value_bytes = value.encode('utf-16-le')
-                        values[i] = converter(value_bytes)
-                    else:
-                        values[i] = converter(value)
-                except Exception:
-                    pass
-
     def __getitem__(self, index):
         return self._values[index]
     
@@ -51,15 +36,16 @@ class Row:
         except AttributeError:
             raise AttributeError(f"Row has no attribute '{name}'")
         
-        if column_map is not None and name in column_map:
-            return object.__getattribute__(self, '_values')[column_map[name]]
+        idx = column_map.get(name, _MISSING) if column_map is not None else _MISSING
+        if idx is not _MISSING:
+            return object.__getattribute__(self, '_values')[idx]
         
-        cursor = object.__getattribute__(self, '_cursor_ref')
-        if hasattr(cursor, 'lowercase') and cursor.lowercase:
-            name_lower = name.lower()
-            for col_name in column_map:
-                if col_name.lower() == name_lower:
-                    return object.__getattribute__(self, '_values')[column_map[col_name]]
+        # Only set when the cursor had lowercase enabled at fetch time
+        column_map_lower = object.__getattribute__(self, '_column_map_lower')
+        if column_map_lower is not None:
+            idx = column_map_lower.get(name.lower(), _MISSING)
+            if idx is not _MISSING:
+                return object.__getattribute__(self, '_values')[idx]
         
         raise AttributeError(f"Row has no attribute '{name}'")
     
@@ -70,10 +56,19 @@ class Row:
 
     def __eq__(self, other):
         if isinstance(other, list):
-            return list(self._values) == other
+            values = self._values
+            if type(values) is list:
+                return values == other
+            return len(values) == len(other) and all(a == b for a, b in zip(values, other))
         elif isinstance(other, Row):
-            return self._values == other._values
+            values, other_values = self._values, other._values
+            if len(values) != len(other_values):
+                return False
+            return values == other_values
         return super().__eq__(other)
+
+    # Rows compare by value and their values may change, so they are not hashable
+    __hash__ = None
     
     def __len__(self):
         return len(self._values)
@@ -82,24 +77,115 @@ class Row:
         return iter(self._values)
     
     def __str__(self):
-        from decimal import Decimal
-        from whiskers import getDecimalSeparator
-        
-        parts = []
-        for value in self:
-            if isinstance(value, Decimal):
-                sep = getDecimalSeparator()
-                if sep != '.' and value is not None:
-                    s = str(value)
-                    if '.' in s:
-                        s = s.replace('.', sep)
-                    parts.append(s)
-                else:
-                    parts.append(str(value))
-            else:
-                parts.append(repr(value))
-        
+        if not self._has_decimal_col:
+            return "(" + ", ".join(map(repr, self._values)) + ")"
+        # The separator is fixed for the duration of the call; Decimals are
+        # shown with str() so they honour it, everything else with repr()
+        sep = getDecimalSeparator()
+        parts = [_format_decimal(value, sep) if isinstance(value, Decimal) else repr(value)
+                 for value in self._values]
         return "(" + ", ".join(parts) + ")"
 
     def __repr__(self):
         return repr(tuple(self._values))
+
+
+# Row subclasses keyed by column layout; see row_class().
+_row_class_cache = {}
+_ROW_CLASS_CACHE_SIZE = 256
+
+
+def _column_property(index):
+    return property(lambda self: self._values[index])
+
+
+def row_class(column_map, column_map_lower=None, has_decimal=True):
+    """
+    Return a Row subclass that exposes each column as a property.
+
+    Attribute access on these rows is a plain descriptor lookup instead of a
+    miss into Row.__getattr__. Classes are cached per column layout, so every
+    result set with the same columns shares one class. Lowercase aliases are
+    only added when column_map_lower is given; names that clash with Row's own
+    attributes are left to __getattr__ as before. Classes built with
+    has_decimal=False format rows with a single join in __str__.
+    """
+    if not column_map:
+        return Row
+    key = (tuple(column_map.items()),
+           tuple(column_map_lower.items()) if column_map_lower is not None else None,
+           has_decimal)
+    cls = _row_class_cache.get(key)
+    if cls is None:
+        namespace = {'__slots__': (), '_has_decimal_col': has_decimal}
+        for name, index in column_map.items():
+            if not hasattr(Row, name):
+                namespace[name] = _column_property(index)
+        if column_map_lower is not None:
+            for name, index in column_map_lower.items():
+                if name not in namespace and not hasattr(Row, name):
+                    namespace[name] = _column_property(index)
+        cls = type('Row', (Row,), namespace)
+        if len(_row_class_cache) >= _ROW_CLASS_CACHE_SIZE:
+            _row_class_cache.clear()
+        _row_class_cache[key] = cls
+    return cls
+
+
+class RowBatch:
+    """
+    All rows of a fetch stored as one flat, row-major list of values.
+
+    Row objects are only built when a row is indexed or iterated, so consumers
+    that want whole columns (e.g. to build a DataFrame) can call columns() and
+    never pay for per-row objects.
+    """
+
+    __slots__ = ('_values', '_width', '_description', '_column_map', '_column_map_lower', '_cursor_ref',
+                 '_row_cls')
+
+    def __init__(self, cursor, description, values, width, column_map=None, column_map_lower=None,
+                 row_cls=Row):
+        self._values = values
+        self._width = width
+        self._description = description
+        self._column_map = column_map
+        self._column_map_lower = column_map_lower
+        self._cursor_ref = cursor
+        self._row_cls = row_cls
+
+    def __len__(self):
+        return len(self._values) // self._width if self._width else 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("RowBatch index out of range")
+        start = index * self._width
+        return self._row_cls(self._cursor_ref, self._description,
+                             self._values[start:start + self._width], self._column_map, self._column_map_lower)
+
+    def __iter__(self):
+        values, width = self._values, self._width
+        cursor, description = self._cursor_ref, self._description
+        column_map, column_map_lower = self._column_map, self._column_map_lower
+        row_cls = self._row_cls
+        for start in range(0, len(self) * width, width):
+            yield row_cls(cursor, description, values[start:start + width], column_map, column_map_lower)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, RowBatch)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def columns(self):
+        """Return the values as one list per column."""
+        values, width = self._values, self._width
+        return [values[c::width] for c in range(width)]
+
+    def __repr__(self):
+        return repr(list(self))
@@ -1,18 +1,43 @@
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
-use std::net::TcpStream;
+use socket2::{Domain, Protocol, Socket, Type};
+use std::io;
+use std::net::{TcpStream, ToSocketAddrs};
 use tabby::{AuthMethod, Config, EncryptionLevel, SyncClient};
 
 use crate::cursor::{SharedTxState, TdsCursor, TransactionState};
 use crate::errors::to_pyerr;
 use crate::row_writer::{CompactValue, MultiSetWriter};
+use crate::statement_cache::{SharedStatementCache, StatementCache};
 use std::sync::{Arc, Mutex};
 
 pub type SharedClient = Arc<Mutex<SyncClient<TcpStream>>>;
 
+/// Open the TDS socket with Nagle disabled before connecting. Buffer sizes are
+/// left to the kernel: setting SO_RCVBUF by hand turns off Linux receive-buffer
+/// autotuning, which grows the window further than any fixed size would.
+fn connect_tcp(addr: impl ToSocketAddrs) -> io::Result<TcpStream> {
+    let mut last_err = None;
+    for addr in addr.to_socket_addrs()? {
+        let socket = Socket::new(Domain::for_address(addr), Type::STREAM, Some(Protocol::TCP))?;
+        socket.set_nodelay(true)?;
+        match socket.connect(&addr.into()) {
+            Ok(()) => return Ok(socket.into()),
+            Err(e) => last_err = Some(e),
+        }
+    }
+    Err(last_err.unwrap_or_else(|| {
+        io::Error::new(
+            io::ErrorKind::InvalidInput,
+            "could not resolve to any addresses",
+        )
+    }))
+}
+
 pub struct TdsConnection {
     client: Option<SharedClient>,
     tx_state: SharedTxState,
+    statements: SharedStatementCache,
 }
 
 fn parse_connection_string(conn_str: &str) -> (String, u16, String, String, String, bool) {
@@ -84,21 +109,16 @@ impl TdsConnection {
                 config.database(&database);
                 config.authentication(AuthMethod::sql_server(&uid, &pwd));
                 config.trust_cert();
-                // SyncClient doesn't support TLS yet
+                // SyncClient doesn't support TLS yet, so there is no TLS
+                // session to cache or resume between connections
                 config.encryption(EncryptionLevel::NotSupported);
 
-                let tcp = TcpStream::connect(config.get_addr()).map_err(|e| {
+                let tcp = connect_tcp(config.get_addr()).map_err(|e| {
                     pyo3::exceptions::PyConnectionError::new_err(format!(
                         "TCP connect failed: {}",
                         e
                     ))
                 })?;
-                tcp.set_nodelay(true).map_err(|e| {
-                    pyo3::exceptions::PyConnectionError::new_err(format!(
-                        "set_nodelay failed: {}",
-                        e
-                    ))
-                })?;
 
                 let client = SyncClient::connect(config, tcp).map_err(|e| {
                     pyo3::exceptions::PyConnectionError::new_err(format!(
@@ -117,6 +137,7 @@ impl TdsConnection {
                 autocommit: false,
                 in_transaction: false,
             })),
+            statements: Arc::new(Mutex::new(StatementCache::new())),
         })
     }
 
@@ -177,13 +198,22 @@ impl TdsConnection {
         Ok(())
     }
 
+    /// One round trip to the server, to check an idle connection is still alive.
+    pub fn ping(&self) -> PyResult<()> {
+        self.exec_simple("SELECT 1")
+    }
+
     pub fn get_autocommit(&self) -> bool {
         self.tx_state.lock().unwrap().autocommit
     }
 
     pub fn alloc_cursor(&mut self) -> PyResult<TdsCursor> {
         let client = self.get_client()?;
-        Ok(TdsCursor::new(client, self.tx_state.clone()))
+        Ok(TdsCursor::new(
+            client,
+            self.tx_state.clone(),
+            self.statements.clone(),
+        ))
     }
 
     pub fn query_single_string(&self, sql: &str) -> PyResult<Option<String>> {
@@ -4,6 +4,7 @@ use pyo3::types::PyList;
 use crate::connection::SharedClient;
 use crate::errors::to_pyerr;
 use crate::row_writer::{CompactValue, PyRowWriter};
+use crate::statement_cache::{SharedStatementCache, StatementTemplate};
 use crate::types::{column_type_to_sql_type, compact_value_to_py, py_to_sql_literal};
 use std::sync::{Arc, Mutex};
 
@@ -49,6 +50,7 @@ struct ResultSet {
 pub struct TdsCursor {
     client: SharedClient,
     tx_state: SharedTxState,
+    statements: SharedStatementCache,
     columns: Option<Vec<ColumnInfo>>,
     writer: Option<PyRowWriter>,
     /// Direct row tuples — pre-built during TDS decode
@@ -58,13 +60,20 @@ pub struct TdsCursor {
     _rowcount: i64,
     pending: Vec<ResultSet>,
     messages: Vec<(String, String)>,
+    /// Statements queued by `queue` while a batch is open, sent by `flush_batch`
+    batch: Option<String>,
 }
 
 impl TdsCursor {
-    pub fn new(client: SharedClient, tx_state: SharedTxState) -> Self {
+    pub fn new(
+        client: SharedClient,
+        tx_state: SharedTxState,
+        statements: SharedStatementCache,
+    ) -> Self {
         TdsCursor {
             client,
             tx_state,
+            statements,
             columns: None,
             writer: None,
             direct_rows: None,
@@ -73,6 +82,7 @@ impl TdsCursor {
             _rowcount: -1,
             pending: Vec::new(),
             messages: Vec::new(),
+            batch: None,
         }
     }
 
@@ -81,6 +91,7 @@ impl TdsCursor {
         self.writer = None;
         self.direct_rows = None;
         self.pending.clear();
+        self.batch = None;
         Ok(())
     }
 
@@ -94,14 +105,51 @@ impl TdsCursor {
         }
     }
 
+    /// Final SQL text for `sql` with `params` inlined; the placeholder scan is
+    /// cached per SQL text on the connection.
+    fn prepare_sql(&self, sql: &str, params: &[Bound<'_, PyAny>]) -> PyResult<String> {
+        if params.is_empty() {
+            return Ok(convert_call_syntax(sql));
+        }
+        let template = self
+            .statements
+            .lock()
+            .unwrap()
+            .get_or_insert_with(sql, || StatementTemplate::parse(&convert_call_syntax(sql)));
+        Python::with_gil(|py| template.render(py, params))
+    }
+
     pub fn execute(&mut self, sql: &str, params: &[Bound<'_, PyAny>]) -> PyResult<i32> {
-        let sql = convert_call_syntax(sql);
-        let final_sql = if params.is_empty() {
-            sql.to_string()
-        } else {
-            Python::with_gil(|py| substitute_params(py, &sql, params))?
-        };
+        let final_sql = self.prepare_sql(sql, params)?;
+        self.run(&final_sql)
+    }
+
+    /// Open a batch: statements passed to `queue` are collected and only
+    /// written to the server, in one round trip, by `flush_batch`.
+    pub fn begin_batch(&mut self) {
+        self.batch.get_or_insert_with(String::new);
+    }
+
+    pub fn queue(&mut self, sql: &str, params: &[Bound<'_, PyAny>]) -> PyResult<()> {
+        let final_sql = self.prepare_sql(sql, params)?;
+        let batch = self
+            .batch
+            .as_mut()
+            .ok_or_else(|| pyo3::exceptions::PyRuntimeError::new_err("No batch in progress"))?;
+        batch.push_str(&final_sql);
+        batch.push_str("\n;\n");
+        Ok(())
+    }
+
+    /// Send the queued statements as a single SQL batch and close the batch.
+    pub fn flush_batch(&mut self) -> PyResult<i32> {
+        match self.batch.take() {
+            Some(sql) if !sql.is_empty() => self.run(&sql),
+            _ => Ok(0),
+        }
+    }
 
+    fn run(&mut self, final_sql: &str) -> PyResult<i32> {
         let tx_prefix = self.begin_transaction_if_needed()?;
         let client = self.client.clone();
 
@@ -113,7 +161,7 @@ impl TdsCursor {
         self._rowcount = -1;
         self.pending.clear();
 
-        self.execute_direct(client, &final_sql, tx_prefix)
+        self.execute_direct(client, final_sql, tx_prefix)
     }
 
     /// Two-phase execute:
@@ -643,6 +691,37 @@ impl TdsCursor {
         Ok(result)
     }
 
+    /// Fetch all remaining rows as one flat, row-major Vec of values plus the
+    /// column count, so callers can wrap rows lazily instead of building a list per row.
+    pub fn fetchall_flat(&mut self, py: Python<'_>) -> PyResult<(Vec<PyObject>, usize)> {
+        if let Some(ref rows) = self.direct_rows {
+            let col_count = self.direct_col_count;
+            let remaining = rows.len().saturating_sub(self.row_index);
+            let mut flat = Vec::with_capacity(remaining * col_count);
+            for row in rows.iter().skip(self.row_index) {
+                for item in row.bind(py).downcast::<pyo3::types::PyTuple>()?.iter() {
+                    flat.push(item.unbind());
+                }
+            }
+            self.row_index = rows.len();
+            return Ok((flat, col_count));
+        }
+
+        let writer = match self.writer.as_ref() {
+            Some(w) => w,
+            None => return Ok((Vec::new(), 0)),
+        };
+        let total = writer.row_count();
+        let col_count = writer.col_count;
+        let values = &writer.values[self.row_index * col_count..total * col_count];
+        let mut flat = Vec::with_capacity(values.len());
+        for value in values {
+            flat.push(compact_value_to_py(py, value)?);
+        }
+        self.row_index = total;
+        Ok((flat, col_count))
+    }
+
     /// Optimized fetchall that writes directly into a PyList of PyLists,
     /// avoiding intermediate Vec<Vec<PyObject>> allocation.
     pub fn fetchall_into(
@@ -743,35 +822,3 @@ impl TdsCursor {
         &self.messages
     }
 }
-
-fn substitute_params(py: Python<'_>, sql: &str, params: &[Bound<'_, PyAny>]) -> PyResult<String> {
-    let mut result = String::with_capacity(sql.len() + params.len() * 16);
-    let mut param_idx = 0;
-    let mut chars = sql.chars().peekable();
-    while let Some(c) = chars.next() {
-        if c == '?' {
-            if param_idx < params.len() {
-                let literal = py_to_sql_literal(py, &params[param_idx])?;
-                result.push_str(&literal);
-                param_idx += 1;
-            } else {
-                result.push('?');
-            }
-        } else if c == '\'' {
-            result.push(c);
-            while let Some(sc) = chars.next() {
-                result.push(sc);
-                if sc == '\'' {
-                    if chars.peek() == Some(&'\'') {
-                        result.push(chars.next().unwrap());
-                    } else {
-                        break;
-                    }
-                }
-            }
-        } else {
-            result.push(c);
-        }
-    }
-    Ok(result)
-}
@@ -5,6 +5,7 @@ mod connection;
 mod cursor;
 mod errors;
 pub mod row_writer;
+mod statement_cache;
 mod types;
 
 use connection::TdsConnection;
@@ -16,12 +17,18 @@ use cursor::TdsCursor;
 pub struct NativeRow {
     values: PyObject,     // PyTuple
     column_map: PyObject, // PyDict (shared across all rows)
+    // Lowercased names -> index, only while cursor.lowercase is set (shared like column_map)
+    column_map_lower: Option<PyObject>,
     #[allow(dead_code)]
     cursor_ref: PyObject,
 }
 
 #[pymethods]
 impl NativeRow {
+    // Rows compare by value, so like Row they are not hashable
+    #[classattr]
+    const __hash__: Option<PyObject> = None;
+
     fn __getitem__(&self, py: Python<'_>, index: isize) -> PyResult<PyObject> {
         let tuple = self.values.bind(py);
         let len = tuple.len()? as isize;
@@ -76,6 +83,13 @@ impl NativeRow {
             let i: usize = idx.extract()?;
             return self.values.bind(py).get_item(i).map(|o| o.unbind());
         }
+        if let Some(lower) = &self.column_map_lower
+            && let Ok(idx) = lower.bind(py).get_item(name.to_lowercase())
+            && !idx.is_none()
+        {
+            let i: usize = idx.extract()?;
+            return self.values.bind(py).get_item(i).map(|o| o.unbind());
+        }
         Err(pyo3::exceptions::PyAttributeError::new_err(format!(
             "Row has no attribute '{}'",
             name
@@ -188,6 +202,9 @@ impl PyConnection {
     fn get_autocommit(&self) -> bool {
         self.inner.get_autocommit()
     }
+    fn ping(&self) -> PyResult<()> {
+        self.inner.ping()
+    }
 
     fn alloc_statement_handle(&mut self) -> PyResult<StatementHandle> {
         let cursor = self.inner.alloc_cursor()?;
@@ -286,6 +303,28 @@ fn ddbc_sql_execute(
     stmt.cursor.execute(sql, &params)
 }
 
+#[pyfunction]
+#[pyo3(name = "DDBCSQLBeginBatch")]
+fn ddbc_sql_begin_batch(stmt: &mut StatementHandle) {
+    stmt.cursor.begin_batch()
+}
+
+#[pyfunction]
+#[pyo3(name = "DDBCSQLBatchAppend")]
+fn ddbc_sql_batch_append(
+    stmt: &mut StatementHandle,
+    sql: &str,
+    params: Vec<Bound<'_, PyAny>>,
+) -> PyResult<()> {
+    stmt.cursor.queue(sql, &params)
+}
+
+#[pyfunction]
+#[pyo3(name = "DDBCSQLFlushBatch")]
+fn ddbc_sql_flush_batch(stmt: &mut StatementHandle) -> PyResult<i32> {
+    stmt.cursor.flush_batch()
+}
+
 #[pyfunction]
 #[pyo3(name = "DDBCSQLRowCount")]
 fn ddbc_sql_row_count(stmt: &StatementHandle) -> PyResult<i64> {
@@ -358,15 +397,32 @@ fn ddbc_sql_fetch_all(
     Ok(0)
 }
 
+/// Fetch all remaining rows as a flat, row-major list of values.
+/// Returns (values, column_count); no per-row Python objects are created.
+#[pyfunction]
+#[pyo3(name = "DDBCSQLFetchAllFlat")]
+fn ddbc_sql_fetch_all_flat(
+    py: Python<'_>,
+    stmt: &mut StatementHandle,
+) -> PyResult<(PyObject, usize)> {
+    let (values, col_count) = stmt.cursor.fetchall_flat(py)?;
+    Ok((
+        pyo3::types::PyList::new(py, values)?.into_any().unbind(),
+        col_count,
+    ))
+}
+
 /// Fast fetchall that returns NativeRow objects directly from Rust.
 /// Avoids Python-level Row.__init__ overhead entirely.
 #[pyfunction]
 #[pyo3(name = "DDBCSQLFetchAllNative")]
+#[pyo3(signature = (stmt, column_map, cursor_ref, column_map_lower=None))]
 fn ddbc_sql_fetch_all_native(
     py: Python<'_>,
     stmt: &mut StatementHandle,
     column_map: PyObject,
     #[allow(dead_code)] cursor_ref: PyObject,
+    column_map_lower: Option<PyObject>,
 ) -> PyResult<PyObject> {
     let has_direct = stmt.cursor.direct_rows().is_some();
     let total = stmt.cursor.row_count_total();
@@ -380,6 +436,7 @@ fn ddbc_sql_fetch_all_native(
             let row = NativeRow {
                 values: direct_row.clone_ref(py),
                 column_map: column_map.clone_ref(py),
+                column_map_lower: column_map_lower.as_ref().map(|m| m.clone_ref(py)),
                 cursor_ref: cursor_ref.clone_ref(py),
             };
             result.push(row.into_pyobject(py)?.into_any().unbind());
@@ -390,6 +447,7 @@ fn ddbc_sql_fetch_all_native(
             let row = NativeRow {
                 values: py_row,
                 column_map: column_map.clone_ref(py),
+                column_map_lower: column_map_lower.as_ref().map(|m| m.clone_ref(py)),
                 cursor_ref: cursor_ref.clone_ref(py),
             };
             result.push(row.into_pyobject(py)?.into_any().unbind());
@@ -967,12 +1025,16 @@ fn whiskers_native(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<ParamInfo>()?;
     m.add_class::<NativeRow>()?;
     m.add_function(wrap_pyfunction!(ddbc_sql_execute, m)?)?;
+    m.add_function(wrap_pyfunction!(ddbc_sql_begin_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(ddbc_sql_batch_append, m)?)?;
+    m.add_function(wrap_pyfunction!(ddbc_sql_flush_batch, m)?)?;
     m.add_function(wrap_pyfunction!(ddbc_sql_row_count, m)?)?;
     m.add_function(wrap_pyfunction!(ddbc_sql_describe_col, m)?)?;
     m.add_function(wrap_pyfunction!(ddbc_sql_fetch_one, m)?)?;
     m.add_function(wrap_pyfunction!(ddbc_sql_fetch_many, m)?)?;
     m.add_function(wrap_pyfunction!(ddbc_sql_fetch_all, m)?)?;
     m.add_function(wrap_pyfunction!(ddbc_sql_fetch_all_native, m)?)?;
+    m.add_function(wrap_pyfunction!(ddbc_sql_fetch_all_flat, m)?)?;
     m.add_function(wrap_pyfunction!(ddbc_sql_more_results, m)?)?;
     m.add_function(wrap_pyfunction!(ddbc_sql_set_stmt_attr, m)?)?;
     m.add_function(wrap_pyfunction!(ddbc_sql_get_all_diag_records, m)?)?;
@@ -0,0 +1,112 @@
+//! Per-connection cache of parsed statement text.
+//!
+//! Parameters are inlined as SQL literals, so there is no server-side prepare
+//! to reuse. What repeats on every execute of the same SQL is the client-side
+//! work: `{call ...}` rewriting and scanning the text for `?` placeholders
+//! outside string literals. Both are done once per distinct SQL text and kept
+//! in a small LRU shared by all cursors of a connection.
+
+use pyo3::prelude::*;
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex};
+
+use crate::types::py_to_sql_literal;
+
+pub const STATEMENT_CACHE_SIZE: usize = 32;
+
+/// SQL text split at its `?` placeholders: `pieces.len()` is the placeholder
+/// count plus one.
+pub struct StatementTemplate {
+    pieces: Vec<String>,
+    text_len: usize,
+}
+
+impl StatementTemplate {
+    pub fn parse(sql: &str) -> Self {
+        let mut pieces = Vec::new();
+        let mut current = String::with_capacity(sql.len());
+        let mut chars = sql.chars().peekable();
+        while let Some(c) = chars.next() {
+            if c == '?' {
+                pieces.push(std::mem::take(&mut current));
+            } else if c == '\'' {
+                current.push(c);
+                while let Some(sc) = chars.next() {
+                    current.push(sc);
+                    if sc == '\'' {
+                        if chars.peek() == Some(&'\'') {
+                            current.push(chars.next().unwrap());
+                        } else {
+                            break;
+                        }
+                    }
+                }
+            } else {
+                current.push(c);
+            }
+        }
+        pieces.push(current);
+        StatementTemplate {
+            pieces,
+            text_len: sql.len(),
+        }
+    }
+
+    /// Substitute `params` as literals; placeholders without a parameter stay `?`.
+    pub fn render(&self, py: Python<'_>, params: &[Bound<'_, PyAny>]) -> PyResult<String> {
+        let mut result = String::with_capacity(self.text_len + params.len() * 16);
+        let (last, pieces) = self.pieces.split_last().unwrap();
+        for (i, piece) in pieces.iter().enumerate() {
+            result.push_str(piece);
+            match params.get(i) {
+                Some(param) => result.push_str(&py_to_sql_literal(py, param)?),
+                None => result.push('?'),
+            }
+        }
+        result.push_str(last);
+        Ok(result)
+    }
+}
+
+pub struct StatementCache {
+    entries: HashMap<String, (Arc<StatementTemplate>, u64)>,
+    tick: u64,
+}
+
+pub type SharedStatementCache = Arc<Mutex<StatementCache>>;
+
+impl StatementCache {
+    pub fn new() -> Self {
+        StatementCache {
+            entries: HashMap::with_capacity(STATEMENT_CACHE_SIZE),
+            tick: 0,
+        }
+    }
+
+    /// Return the template for `sql`, parsing it with `parse` on a miss and
+    /// evicting the least recently used entry when the cache is full.
+    pub fn get_or_insert_with(
+        &mut self,
+        sql: &str,
+        parse: impl FnOnce() -> StatementTemplate,
+    ) -> Arc<StatementTemplate> {
+        self.tick += 1;
+        if let Some((template, last_used)) = self.entries.get_mut(sql) {
+            *last_used = self.tick;
+            return template.clone();
+        }
+        if self.entries.len() >= STATEMENT_CACHE_SIZE
+            && let Some(oldest) = self
+                .entries
+                .iter()
+                .min_by_key(|(_, (_, last_used))| *last_used)
+                .map(|(key, _)| key.clone())
+        {
+            self.entries.remove(&oldest);
+        }
+        let template = Arc::new(parse());
+        self.entries
+            .insert(sql.to_string(), (template.clone(), self.tick));
+        template
+    }
+}
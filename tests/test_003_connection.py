@@ -280,6 +280,38 @@ def test_invalid_connection_string():
     with pytest.raises(Exception):
         Connection("invalid_connection_string")
 
+def test_async_connect_concurrent(conn_str):
+    """Test that async_connect opens connections concurrently from one event loop"""
+    import asyncio
+    from whiskers import async_connect
+
+    async def open_all():
+        return await asyncio.gather(*(async_connect(conn_str) for _ in range(5)))
+
+    conns = asyncio.run(open_all())
+    try:
+        assert len(conns) == 5
+        for conn in conns:
+            assert isinstance(conn, Connection)
+            assert conn.cursor().execute("SELECT 1").fetchval() == 1
+    finally:
+        for conn in conns:
+            conn.close()
+
+def test_connection_close_flushes_pipelined_errors(conn_str):
+    """Test that close() raises errors of INSERTs still buffered by a pipelined cursor"""
+    temp_conn = connect(conn_str, autocommit=True)
+    cursor = temp_conn.cursor()
+    cursor.execute("CREATE TABLE #pytest_close_pipelined (id INT PRIMARY KEY)")
+    cursor.pipelined = True
+    cursor.execute("INSERT INTO #pytest_close_pipelined VALUES (?)", 1)
+    cursor.execute("INSERT INTO #pytest_close_pipelined VALUES (?)", 1)
+    with pytest.raises(DatabaseError):
+        temp_conn.close()
+    # Nothing is pending any more, so the second close goes through
+    temp_conn.close()
+    assert temp_conn._closed
+
 def test_connection_close(conn_str):
     # Create a separate connection just for this test
     temp_conn = connect(conn_str)
@@ -3843,6 +3875,27 @@ def test_output_converter_exception_handling(db_connection):
         # Clean up
         db_connection.clear_output_converters()
 
+def test_output_converter_change_between_fetches(db_connection):
+    """Test that converters registered or removed mid-result-set apply to subsequent fetches"""
+    cursor = db_connection.cursor()
+
+    cursor.execute("SELECT N'a' AS col UNION ALL SELECT N'b' UNION ALL SELECT N'c'")
+    str_type = cursor.description[0][1]
+
+    # No converter yet
+    assert cursor.fetchone()[0] == 'a'
+
+    # Registering a converter after execute still applies to the next fetch
+    db_connection.add_output_converter(str_type, custom_string_converter)
+    assert cursor.fetchone()[0].startswith("CONVERTED:")
+
+    # Removing it stops conversion for the remaining rows
+    db_connection.remove_output_converter(str_type)
+    assert cursor.fetchall()[0][0] == 'c'
+
+    # Clean up
+    db_connection.clear_output_converters()
+
 def test_timeout_default(db_connection):
     """Test that the default timeout value is 0 (no timeout)"""
     assert hasattr(db_connection, 'timeout'), "Connection should have a timeout attribute"
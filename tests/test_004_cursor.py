@@ -777,6 +777,39 @@ def test_fetchall(cursor):
     assert isinstance(rows, list), "fetchall should return a list"
     assert len(rows) == len(PARAM_TEST_DATA), "Incorrect number of rows returned"
 
+def test_fetchbatch(cursor):
+    """Test fetching all rows as a lazily wrapped RowBatch"""
+    cursor.execute("SELECT * FROM #pytest_all_data_types ORDER BY id")
+    expected = cursor.fetchall()
+    cursor.execute("SELECT * FROM #pytest_all_data_types ORDER BY id")
+    batch = cursor.fetchbatch()
+    assert len(batch) == len(expected), "Incorrect number of rows returned"
+    assert batch == expected, "RowBatch rows should match fetchall() rows"
+    assert batch[-1] == expected[-1], "Negative indexing should match fetchall()"
+    assert batch[0].id == expected[0][0], "Attribute access should work on batch rows"
+    columns = batch.columns()
+    assert len(columns) == len(cursor.description), "columns() should return one list per column"
+    assert columns[0] == [row[0] for row in expected], "columns() should be column-major"
+    assert len(cursor.fetchbatch()) == 0, "fetchbatch() after exhaustion should be empty"
+
+def test_fetchone_prefetch_keeps_position(cursor):
+    """Test that rows read ahead by fetchone() are not lost by other fetches or scrolling"""
+    query = "SELECT n FROM (VALUES (0),(1),(2),(3),(4),(5),(6),(7),(8),(9)) AS t(n) ORDER BY n"
+    cursor.execute(query)
+    assert cursor.fetchone()[0] == 0
+    assert [r[0] for r in cursor.fetchmany(2)] == [1, 2]
+    assert cursor.fetchone()[0] == 3
+    cursor.skip(2)
+    assert cursor.fetchone()[0] == 6
+    assert [r[0] for r in cursor.fetchall()] == [7, 8, 9]
+    assert cursor.fetchone() is None
+
+    cursor.execute(query)
+    assert cursor.fetchone()[0] == 0
+    cursor.scroll(5, mode='absolute')
+    assert cursor.fetchone()[0] == 5
+    assert cursor.rownumber == 5
+
 def test_execute_invalid_query(cursor):
     """Test executing an invalid query"""
     with pytest.raises(Exception):
@@ -1278,6 +1311,117 @@ def test_executemany_mixed_ints(cursor, db_connection):
         db_connection.commit()
 
 
+def test_execute_pipelined_inserts(cursor, db_connection):
+    """Test that pipelined mode buffers repeated INSERTs and flushes them as one batch."""
+    try:
+        cursor.execute("CREATE TABLE #pytest_pipelined (id INT, name NVARCHAR(20))")
+        cursor.pipelined = True
+        for i in range(100):
+            cursor.execute("INSERT INTO #pytest_pipelined VALUES (?, ?)", i, f"row{i}")
+        assert cursor._pipeline_sql is not None, "Inserts should be buffered"
+        assert len(cursor._pipeline_params) == 100
+
+        # A different statement flushes the buffered rows first
+        cursor.execute("SELECT COUNT(*), MAX(name) FROM #pytest_pipelined WHERE name = 'row' + CAST(id AS NVARCHAR(10))")
+        assert cursor._pipeline_sql is None
+        assert tuple(cursor.fetchone()) == (100, "row99")
+
+        # commit() flushes pending rows as well
+        cursor.execute("INSERT INTO #pytest_pipelined VALUES (?, ?)", 100, "row100")
+        db_connection.commit()
+        assert cursor._pipeline_sql is None
+        cursor.pipelined = False
+        assert cursor.execute("SELECT COUNT(*) FROM #pytest_pipelined").fetchval() == 101
+    finally:
+        cursor.pipelined = False
+        cursor.execute("DROP TABLE IF EXISTS #pytest_pipelined")
+        db_connection.commit()
+
+
+def test_execute_pipelined_only_plain_inserts(cursor, db_connection):
+    """Test that pipelined mode runs INSERTs with results at once and other cursors see buffered rows."""
+    other = db_connection.cursor()
+    try:
+        cursor.execute("CREATE TABLE #pytest_pipelined_plain (id INT IDENTITY(1,1), name NVARCHAR(20))")
+        cursor.pipelined = True
+        cursor.execute("INSERT INTO #pytest_pipelined_plain (name) OUTPUT INSERTED.id VALUES (?)", "a")
+        assert cursor._pipeline_sql is None, "INSERT with OUTPUT should not be buffered"
+        assert cursor.fetchone()[0] == 1
+
+        cursor.execute("INSERT INTO #pytest_pipelined_plain (name) VALUES (?); SELECT SCOPE_IDENTITY()", "b")
+        assert cursor._pipeline_sql is None, "INSERT followed by another statement should not be buffered"
+
+        cursor.execute("INSERT INTO #pytest_pipelined_plain (name) VALUES (?)", "c")
+        assert cursor._pipeline_sql is not None
+        # Another cursor of the same connection sees the buffered row
+        assert other.execute("SELECT COUNT(*) FROM #pytest_pipelined_plain").fetchval() == 3
+        assert cursor._pipeline_sql is None
+    finally:
+        cursor.pipelined = False
+        other.close()
+        cursor.execute("DROP TABLE IF EXISTS #pytest_pipelined_plain")
+        db_connection.commit()
+
+
+def test_execute_pipelined_then_metadata_call(cursor, db_connection):
+    """Test that a catalog call after buffered INSERTs flushes them and keeps its own result set."""
+    try:
+        cursor.execute("CREATE TABLE #pytest_pipelined_meta (id INT)")
+        cursor.pipelined = True
+        cursor.execute("INSERT INTO #pytest_pipelined_meta VALUES (?)", 1)
+        assert len(cursor.getTypeInfo().fetchall()) > 0
+        assert cursor._pipeline_sql is None
+        assert cursor.execute("SELECT COUNT(*) FROM #pytest_pipelined_meta").fetchval() == 1
+    finally:
+        cursor.pipelined = False
+        cursor.execute("DROP TABLE IF EXISTS #pytest_pipelined_meta")
+        db_connection.commit()
+
+
+def test_begin_batch_flush_batch(cursor, db_connection):
+    """Test that statements queued with begin_batch() are sent together by flush_batch()."""
+    try:
+        cursor.execute("CREATE TABLE #pytest_batch (id INT, name NVARCHAR(20))")
+        db_connection.commit()
+
+        cursor.begin_batch()
+        cursor.execute("INSERT INTO #pytest_batch VALUES (?, ?)", 1, "one")
+        cursor.execute("INSERT INTO #pytest_batch VALUES (?, ?)", (2, "two"))
+        cursor.execute("UPDATE #pytest_batch SET name = ? WHERE id = ?", "uno", 1)
+        cursor.execute("DELETE FROM #pytest_batch WHERE id = ?", 2)
+        assert cursor.flush_batch() is cursor
+        db_connection.commit()
+
+        rows = cursor.execute("SELECT id, name FROM #pytest_batch").fetchall()
+        assert [tuple(r) for r in rows] == [(1, "uno")]
+
+        # A fetch flushes the open batch and returns its first result set
+        cursor.begin_batch()
+        cursor.execute("INSERT INTO #pytest_batch VALUES (?, ?)", 3, "three")
+        cursor.execute("SELECT COUNT(*) FROM #pytest_batch")
+        assert cursor.fetchone()[0] == 2
+    finally:
+        cursor.execute("DROP TABLE IF EXISTS #pytest_batch")
+        db_connection.commit()
+
+
+def test_begin_batch_flushed_by_metadata_call(cursor, db_connection):
+    """Test that a catalog call flushes an open batch instead of discarding it."""
+    try:
+        cursor.execute("CREATE TABLE #pytest_batch_meta (id INT)")
+        db_connection.commit()
+
+        cursor.begin_batch()
+        cursor.execute("INSERT INTO #pytest_batch_meta VALUES (?)", 1)
+        assert len(cursor.getTypeInfo().fetchall()) > 0
+        assert not cursor._batching
+
+        assert cursor.execute("SELECT COUNT(*) FROM #pytest_batch_meta").fetchval() == 1
+    finally:
+        cursor.execute("DROP TABLE IF EXISTS #pytest_batch_meta")
+        db_connection.commit()
+
+
 def test_executemany_int_edge_cases(cursor, db_connection):
     """Test executemany with very large and very small integers."""
     try:
@@ -1931,6 +2075,69 @@ def test_row_column_mapping(cursor, db_connection):
         cursor.execute("DROP TABLE #pytest_row_test")
         db_connection.commit()
 
+def test_row_column_map_shared_per_result_set(cursor):
+    """Test that rows of one result set share a single column map, rebuilt per statement"""
+    cursor.execute("SELECT 1 AS a, 2 AS b UNION ALL SELECT 3, 4")
+    rows = cursor.fetchmany(2)
+    assert rows[0]._column_map is rows[1]._column_map, "Rows should share one column map"
+    assert rows[1].b == 4
+
+    cursor.execute("SELECT 5 AS c")
+    row = cursor.fetchone()
+    assert row._column_map is not rows[0]._column_map, "Column map should be rebuilt per statement"
+    assert row.c == 5
+    with pytest.raises(AttributeError):
+        row.a
+
+def test_row_cursor_lowercase_attribute_access(cursor):
+    """Test that cursor.lowercase enables case-insensitive attribute access for rows fetched while it is set"""
+    try:
+        cursor.lowercase = True
+        cursor.execute("SELECT 1 AS MixedCase")
+        row = cursor.fetchone()
+        assert row.mixedcase == 1
+        assert row.MixedCase == 1
+        cursor.execute("SELECT 1 AS MixedCase")
+        assert cursor.fetchall()[0].mixedcase == 1
+
+        cursor.lowercase = False
+        cursor.execute("SELECT 2 AS MixedCase")
+        row = cursor.fetchone()
+        assert row.MixedCase == 2
+        with pytest.raises(AttributeError):
+            row.mixedcase
+    finally:
+        del cursor.lowercase
+
+def test_row_columns_as_properties(cursor):
+    """Test that rows expose columns through a Row subclass shared by equal column layouts"""
+    from whiskers.row import Row
+    cursor.execute("SELECT 1 AS id, 'x' AS name")
+    row1 = cursor.fetchone()
+    cursor.execute("SELECT 2 AS id, 'y' AS name")
+    row2 = cursor.fetchone()
+    assert isinstance(row1, Row)
+    assert type(row1) is type(row2), "Same column layout should reuse the Row subclass"
+    assert isinstance(type(row1).__dict__.get('name'), property)
+    assert (row2.id, row2.name) == (2, 'y')
+    assert row2.cursor_description is cursor.description
+
+def test_row_equality_and_hash(cursor):
+    """Test Row-to-Row equality across result sets of different widths and that rows are unhashable"""
+    cursor.execute("SELECT 1 AS a, 2 AS b")
+    row1 = cursor.fetchone()
+    cursor.execute("SELECT 1 AS a, 2 AS b, 3 AS c")
+    row2 = cursor.fetchone()
+    cursor.execute("SELECT 1 AS x, 2 AS y")
+    row3 = cursor.fetchone()
+    assert row1 != row2, "Rows of different lengths should not be equal"
+    assert row1 == row3, "Rows with equal values should be equal"
+    with pytest.raises(TypeError):
+        hash(row1)
+    cursor.execute("SELECT 1 AS a, 2 AS b")
+    with pytest.raises(TypeError):
+        hash(cursor.fetchall()[0])
+
 def test_lowercase_setting_after_cursor_creation(cursor, db_connection):
     """Test that changing lowercase setting after cursor creation doesn't affect existing cursor"""
     original_lowercase = whiskers.lowercase
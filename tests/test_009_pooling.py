@@ -81,6 +81,123 @@ def test_connection_pooling_reuse_spid(conn_str):
     assert spid1 == spid2, "Connections not reused - different SPIDs"
 
 
+def test_connection_pooling_reuse_across_threads(conn_str):
+    """Test that a connection released by a finished thread is reused by another thread."""
+    pooling(max_size=1, idle_timeout=30)
+    spids = []
+
+    def use_connection():
+        conn = connect(conn_str)
+        cursor = conn.cursor()
+        cursor.execute("SELECT @@SPID")
+        spids.append(cursor.fetchone()[0])
+        conn.close()
+
+    # The first thread parks its connection in its thread-local cache, which
+    # must be handed back to the shared pool when the thread exits
+    for _ in range(2):
+        t = threading.Thread(target=use_connection)
+        t.start()
+        t.join()
+
+    assert len(spids) == 2
+    assert spids[0] == spids[1], "Connection from exited thread was not returned to the shared pool"
+
+
+def test_pool_thread_caches_count_against_max_size():
+    """Test that idle connections parked in thread caches count against max_size."""
+    from whiskers.ddbc_bindings import _ConnectionPool
+
+    class FakeConnection:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    pool = _ConnectionPool()
+    pool.enable(max_size=1, idle_timeout=30)
+    returned = []
+    parked = threading.Barrier(11)
+    release = threading.Event()
+
+    def return_connections():
+        for _ in range(2):
+            conn = FakeConnection()
+            returned.append(conn)
+            pool.put("conn_str", conn)
+        parked.wait()
+        release.wait()
+
+    threads = [threading.Thread(target=return_connections) for _ in range(10)]
+    for t in threads:
+        t.start()
+    try:
+        parked.wait()
+        idle = [conn for conn in returned if not conn.closed]
+        assert len(idle) <= 1, f"{len(idle)} idle connections parked with max_size=1"
+    finally:
+        release.set()
+        for t in threads:
+            t.join()
+        pool.disable()
+
+
+def test_pool_reuses_connections_cached_by_other_threads():
+    """Test that threads taking turns share one idle connection instead of opening new ones."""
+    from whiskers.ddbc_bindings import _ConnectionPool
+
+    class FakeConnection:
+        def close(self):
+            pass
+
+    pool = _ConnectionPool()
+    pool.enable(max_size=4, idle_timeout=30)
+    opened = []
+    turn = threading.Lock()
+
+    def take_turns():
+        for _ in range(100):
+            with turn:
+                conn = pool.get("conn_str")
+                if conn is None:
+                    conn = FakeConnection()
+                    opened.append(conn)
+                pool.put("conn_str", conn)
+
+    threads = [threading.Thread(target=take_turns) for _ in range(10)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(opened) == 1, f"{len(opened)} connections opened for one connection in use at a time"
+    finally:
+        pool.disable()
+
+
+def test_pool_enable_with_new_max_size_resizes_slots():
+    """Test that enabling the pool again with another max_size applies the new limit."""
+    from whiskers.ddbc_bindings import _ConnectionPool
+
+    class FakeConnection:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    pool = _ConnectionPool()
+    try:
+        conns = [FakeConnection() for _ in range(3)]
+        pool.enable(max_size=1, idle_timeout=30)
+        pool.put("conn_str", conns[0])
+        pool.enable(max_size=3, idle_timeout=30)
+        for conn in conns[1:]:
+            pool.put("conn_str", conn)
+        assert not any(conn.closed for conn in conns), "New max_size was not applied"
+    finally:
+        pool.disable()
+
+
 def test_connection_pooling_speed(conn_str):
     """Test that connection pooling provides performance benefits over multiple iterations."""
     # Warm up to eliminate cold start effects
@@ -271,6 +388,53 @@ def test_pool_recovery_after_failed_connection(conn_str):
     conn.close()
 
 
+def test_pool_replaces_server_killed_connection_on_first_statement(conn_str):
+    """Test that a pooled connection killed server-side is evicted and the first statement retried."""
+    pooling(max_size=2, idle_timeout=30)
+    killer = connect(conn_str, autocommit=True)
+    conn = connect(conn_str)
+    cursor = conn.cursor()
+    cursor.execute("SELECT @@SPID")
+    spid = cursor.fetchone()[0]
+    conn.close()
+
+    # Kill the idle pooled session behind the pool's back
+    killer.cursor().execute(f"KILL {spid}")
+    time.sleep(0.5)
+
+    new_conn = connect(conn_str)
+    try:
+        new_cursor = new_conn.cursor()
+        new_cursor.execute("SELECT @@SPID")
+        new_spid = new_cursor.fetchone()[0]
+        assert new_spid != spid, "Dead pooled connection was not replaced"
+    finally:
+        new_conn.close()
+        killer.close()
+
+
+def test_pool_no_retry_after_first_statement(conn_str):
+    """Test that a connection lost after the first statement raises instead of silently reconnecting."""
+    pooling(max_size=2, idle_timeout=30)
+    killer = connect(conn_str, autocommit=True)
+    conn = connect(conn_str)
+    spid = conn.cursor().execute("SELECT @@SPID").fetchone()[0]
+    conn.close()
+
+    conn = connect(conn_str)
+    try:
+        cursor = conn.cursor()
+        # A catalog call is the first statement on the pooled connection
+        assert len(cursor.getTypeInfo().fetchall()) > 0
+        killer.cursor().execute(f"KILL {spid}")
+        time.sleep(0.5)
+        with pytest.raises(Exception):
+            cursor.execute("SELECT 1")
+    finally:
+        conn.close()
+        killer.close()
+
+
 # =============================================================================
 # Pooling Disable Bug Fix Tests
 # =============================================================================